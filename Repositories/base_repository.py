@@ -3,12 +3,13 @@
 # Provides common CRUD (Create, Read, Update, Delete) operations
 
 from typing import TypeVar, Generic, List, Optional
-from dataclasses import dataclass, field
 
 # Type variable for generic repository
 T = TypeVar('T')
 
-@dataclass
+# Sentinel for dict.pop() so a stored None entity still counts as present
+_MISSING = object()
+
 class BaseRepository(Generic[T]):
     """
     BaseRepository provides a template for data storage operations.
@@ -24,8 +25,12 @@ class BaseRepository(Generic[T]):
     - Provides consistent interface for all data operations
     """
     
-    # In-memory storage - in a real app, this could be a database
-    _storage: dict = field(default_factory=dict)
+    # Fixed attribute layout: _storage is a slot, not an instance-dict entry
+    __slots__ = ('_storage',)
+    
+    def __init__(self):
+        # In-memory storage - in a real app, this could be a database
+        self._storage: dict = {}
     
     def create(self, id: str, entity: T) -> T:
         """
@@ -88,10 +93,7 @@ class BaseRepository(Generic[T]):
         Returns:
             True if deleted, False if not found
         """
-        if id in self._storage:
-            del self._storage[id]
-            return True
-        return False
+        return self._storage.pop(id, _MISSING) is not _MISSING
     
     def exists(self, id: str) -> bool:
         """
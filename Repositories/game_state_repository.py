@@ -1,13 +1,60 @@
 # Game State Repository
 # Manages the overall game state including player position, inventory, world, etc.
 
-from typing import Optional, Dict, Any
-from dataclasses import dataclass, field, asdict
+import sys
+from typing import Optional, Dict, Any, Iterable, List
+from dataclasses import dataclass, field, asdict, InitVar
 from models.location import Location
 from models.item import Item
 from models.character import Character
 
-@dataclass
+# Sentinel for dict.pop() so a stored None value still counts as present
+_MISSING = object()
+
+# Allowed values for GameStateData.game_status
+_VALID_STATUSES = frozenset(("playing", "combat", "game_over", "paused"))
+
+class LocationIndex:
+    """
+    Numbers location IDs for visited-location bitmasks.
+    
+    A location gets the next free bit the first time it is seen. Each
+    GameStateRepository owns one index, shared by its current and saved
+    states, so masks are only meaningful together with their index.
+    """
+    
+    __slots__ = ('_bits', '_ids')
+    
+    def __init__(self):
+        self._bits: Dict[str, int] = {}  # Location ID -> bit
+        self._ids: List[str] = []  # Bit position -> location ID
+    
+    def bit(self, location_id: str) -> int:
+        """Get the mask bit of a location ID."""
+        bit = self._bits.get(location_id)
+        if bit is None:
+            bit = self._bits[location_id] = 1 << len(self._ids)
+            self._ids.append(location_id)
+        return bit
+    
+    def mask(self, location_ids: Iterable[str]) -> int:
+        """Build a mask with the bits of several location IDs set."""
+        mask = 0
+        for location_id in location_ids:
+            mask |= self.bit(location_id)
+        return mask
+    
+    def ids(self, mask: int) -> List[str]:
+        """Expand a mask back into location IDs, visiting only its set bits."""
+        ids = self._ids
+        location_ids = []
+        while mask:
+            low = mask & -mask
+            location_ids.append(ids[low.bit_length() - 1])
+            mask ^= low
+        return location_ids
+
+@dataclass(slots=True)
 class GameStateData:
     """
     GameStateData holds all the information about the current game session.
@@ -22,31 +69,67 @@ class GameStateData:
     """
     player_id: str = "player_1"
     current_location_id: str = "start"
-    inventory: list = field(default_factory=list)  # List of item IDs
+    inventory: dict = field(default_factory=dict)  # Item IDs (insertion-ordered keys)
     game_status: str = "playing"  # playing, combat, game_over, paused
-    visited_locations: set = field(default_factory=set)
+    # Accepted for compatibility; stored as bits of visited_mask
+    visited_locations: InitVar[Iterable[str]] = ()
+    visited_mask: int = 0  # Bitmap of visited locations over location_index
+    location_index: LocationIndex = field(default_factory=LocationIndex, repr=False, compare=False)
+    
+    def __post_init__(self, visited_locations: Iterable[str]):
+        if visited_locations:
+            self.visited_mask |= self.location_index.mask(visited_locations)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
             "player_id": self.player_id,
             "current_location_id": self.current_location_id,
-            "inventory": self.inventory,
+            "inventory": list(self.inventory),
             "game_status": self.game_status,
-            "visited_locations": list(self.visited_locations)
+            "visited_locations": self.location_index.ids(self.visited_mask)
         }
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'GameStateData':
-        """Create from dictionary."""
-        visited = set(data.get("visited_locations", []))
+    def from_dict(cls, data: Dict[str, Any],
+                  location_index: Optional[LocationIndex] = None) -> 'GameStateData':
+        """
+        Create from dictionary.
+        
+        Args:
+            data: A dict produced by to_dict()
+            location_index: Index to number the visited locations with
+                            (a new one if None)
+        """
+        if location_index is None:
+            location_index = LocationIndex()
         return cls(
             player_id=data.get("player_id", "player_1"),
-            current_location_id=data.get("current_location_id", "start"),
-            inventory=data.get("inventory", []),
+            current_location_id=sys.intern(data.get("current_location_id", "start")),
+            inventory=dict.fromkeys(map(sys.intern, data.get("inventory", []))),
             game_status=data.get("game_status", "playing"),
-            visited_locations=visited
+            visited_locations=data.get("visited_locations", ()),
+            location_index=location_index
         )
+    
+    def _clone(self) -> 'GameStateData':
+        """Create an independent copy without a dict round-trip."""
+        return GameStateData(
+            player_id=self.player_id,
+            current_location_id=self.current_location_id,
+            inventory=dict(self.inventory),
+            game_status=self.game_status,
+            visited_mask=self.visited_mask,
+            location_index=self.location_index
+        )
+
+def _visited_locations(self) -> List[str]:
+    """IDs of all visited locations."""
+    return self.location_index.ids(self.visited_mask)
+
+# Attached after the class so the dataclass sees visited_locations as the
+# InitVar above rather than as a property
+GameStateData.visited_locations = property(_visited_locations)
 
 
 class GameStateRepository:
@@ -69,6 +152,9 @@ class GameStateRepository:
         
         # Saved games - in memory for now (could be files/database)
         self._saved_games: Dict[str, GameStateData] = {}
+        
+        # Location ID -> visited_mask bit, for this repository's states
+        self._location_index = LocationIndex()
     
     def initialize_new_game(self, player_id: str = "player_1") -> GameStateData:
         """
@@ -83,9 +169,10 @@ class GameStateRepository:
         self._current_state = GameStateData(
             player_id=player_id,
             current_location_id="start",
-            inventory=[],
+            inventory={},
             game_status="playing",
-            visited_locations=set()
+            visited_locations=("start",),
+            location_index=self._location_index
         )
         return self._current_state
     
@@ -108,11 +195,15 @@ class GameStateRepository:
         Returns:
             True if updated successfully
         """
-        if self._current_state:
-            self._current_state.current_location_id = location_id
-            self._current_state.visited_locations.add(location_id)
+        state = self._current_state
+        if state is None:
+            return False
+        # Already there (e.g. a client retry) - nothing to record
+        if state.current_location_id == location_id:
             return True
-        return False
+        state.current_location_id = location_id
+        state.visited_mask |= state.location_index.bit(location_id)
+        return True
     
     def add_item_to_inventory(self, item_id: str) -> bool:
         """
@@ -124,11 +215,14 @@ class GameStateRepository:
         Returns:
             True if added successfully
         """
-        if self._current_state:
-            if item_id not in self._current_state.inventory:
-                self._current_state.inventory.append(item_id)
-                return True
-        return False
+        state = self._current_state
+        if state is None:
+            return False
+        inventory = state.inventory
+        if item_id in inventory:
+            return False
+        inventory[item_id] = None
+        return True
     
     def remove_item_from_inventory(self, item_id: str) -> bool:
         """
@@ -140,11 +234,11 @@ class GameStateRepository:
         Returns:
             True if removed successfully
         """
-        if self._current_state:
-            if item_id in self._current_state.inventory:
-                self._current_state.inventory.remove(item_id)
-                return True
-        return False
+        state = self._current_state
+        if state is None:
+            return False
+        # Single hashed delete instead of a linear list.remove()
+        return state.inventory.pop(item_id, _MISSING) is not _MISSING
     
     def get_inventory(self) -> list:
         """
@@ -153,9 +247,10 @@ class GameStateRepository:
         Returns:
             List of item IDs in inventory
         """
-        if self._current_state:
-            return self._current_state.inventory.copy()
-        return []
+        state = self._current_state
+        if state is None:
+            return []
+        return list(state.inventory)
     
     def set_game_status(self, status: str) -> bool:
         """
@@ -167,11 +262,12 @@ class GameStateRepository:
         Returns:
             True if updated successfully
         """
-        if self._current_state:
-            valid_statuses = ["playing", "combat", "game_over", "paused"]
-            if status in valid_statuses:
-                self._current_state.game_status = status
-                return True
+        state = self._current_state
+        if state is None:
+            return False
+        if status in _VALID_STATUSES:
+            state.game_status = status
+            return True
         return False
     
     def save_game(self, save_name: str = "autosave") -> bool:
@@ -184,12 +280,11 @@ class GameStateRepository:
         Returns:
             True if saved successfully
         """
-        if self._current_state:
-            self._saved_games[save_name] = GameStateData.from_dict(
-                self._current_state.to_dict()
-            )
-            return True
-        return False
+        state = self._current_state
+        if state is None:
+            return False
+        self._saved_games[save_name] = state._clone()
+        return True
     
     def load_game(self, save_name: str = "autosave") -> Optional[GameStateData]:
         """
@@ -203,7 +298,7 @@ class GameStateRepository:
         """
         saved_state = self._saved_games.get(save_name)
         if saved_state:
-            self._current_state = GameStateData.from_dict(saved_state.to_dict())
+            self._current_state = saved_state._clone()
             return self._current_state
         return None
     
@@ -1,10 +1,14 @@
 # Player Repository
 # Manages player characters in the game
 
-from typing import Optional
+import sys
+from typing import List, Optional
 from models.character import Character
 from Repositories.base_repository import BaseRepository
 
+# Character attributes that update_player_stats() can set, in parameter order
+_STAT_FIELDS = ('health', 'mana', 'strength', 'level', 'experience')
+
 class PlayerRepository(BaseRepository[Character]):
     """
     PlayerRepository handles all player-related data operations.
@@ -22,12 +26,22 @@ class PlayerRepository(BaseRepository[Character]):
     - Delete players
     """
     
+    # Whether the default player has been created (it is made at most once,
+    # the first time storage is touched, so deleting it sticks)
+    __slots__ = ('_default_created',)
+    
     def __init__(self):
         super().__init__()
-        # Initialize with a default player for testing
-        self._create_default_player()
+        # The default player for testing is created lazily, on first access
+        self._default_created = False
+    
+    def _ensure_default_player(self):
+        """Create the default player on the first access to storage."""
+        if not self._default_created:
+            self._default_created = True
+            self._create_default_player()
     
-    def _create_default_player(self):
+    def _create_default_player(self) -> Character:
         """Create a default player for testing."""
         default_player = Character(
             id="player_1",
@@ -39,7 +53,39 @@ class PlayerRepository(BaseRepository[Character]):
             level=1,
             experience=0
         )
-        self.create("player_1", default_player)
+        return super().create("player_1", default_player)
+    
+    # Every storage access goes through _ensure_default_player(), so the
+    # repository behaves as if the default player had been created eagerly.
+    
+    def create(self, id: str, entity: Character) -> Character:
+        self._ensure_default_player()
+        return super().create(id, entity)
+    
+    def get(self, id: str) -> Optional[Character]:
+        self._ensure_default_player()
+        return super().get(id)
+    
+    def get_all(self) -> List[Character]:
+        self._ensure_default_player()
+        return super().get_all()
+    
+    def update(self, id: str, entity: Character) -> Optional[Character]:
+        self._ensure_default_player()
+        return super().update(id, entity)
+    
+    def delete(self, id: str) -> bool:
+        self._ensure_default_player()
+        return super().delete(id)
+    
+    def exists(self, id: str) -> bool:
+        self._ensure_default_player()
+        return super().exists(id)
+    
+    def clear(self):
+        # Clearing before first access must not bring the default back later
+        self._default_created = True
+        super().clear()
     
     def get_player(self, player_id: str = "player_1") -> Optional[Character]:
         """
@@ -67,7 +113,9 @@ class PlayerRepository(BaseRepository[Character]):
         Returns:
             The newly created player
         """
-        player_id = f"player_{len(self._storage) + 1}"
+        self._ensure_default_player()
+        # Intern so every later dict probe reuses the cached string hash
+        player_id = sys.intern(f"player_{len(self._storage) + 1}")
         player = Character(
             id=player_id,
             name=name,
@@ -99,17 +147,11 @@ class PlayerRepository(BaseRepository[Character]):
         """
         player = self.get(player_id)
         if player:
-            if health is not None:
-                player.health = health
-            if mana is not None:
-                player.mana = mana
-            if strength is not None:
-                player.strength = strength
-            if level is not None:
-                player.level = level
-            if experience is not None:
-                player.experience = experience
-            return self.update(player_id, player)
+            values = (health, mana, strength, level, experience)
+            for stat, value in zip(_STAT_FIELDS, values):
+                if value is not None:
+                    setattr(player, stat, value)
+            return player
         return None
     
     def add_experience(self, player_id: str, exp: int) -> Optional[Character]:
@@ -129,14 +171,15 @@ class PlayerRepository(BaseRepository[Character]):
             
             # Level up logic: 100 XP per level
             new_level = (player.experience // 100) + 1
-            if new_level > player.level:
+            gained = new_level - player.level
+            if gained > 0:
                 player.level = new_level
-                # Bonus stats on level up
-                player.health += 10
-                player.mana += 5
-                player.strength += 2
+                # Bonus stats for every level gained, not just the first
+                player.health += 10 * gained
+                player.mana += 5 * gained
+                player.strength += 2 * gained
             
-            return self.update(player_id, player)
+            return player
         return None
     
     def take_damage(self, player_id: str, damage: int) -> Optional[Character]:
@@ -153,7 +196,7 @@ class PlayerRepository(BaseRepository[Character]):
         player = self.get(player_id)
         if player:
             player.health = max(0, player.health - damage)
-            return self.update(player_id, player)
+            return player
         return None
     
     def heal(self, player_id: str, amount: int) -> Optional[Character]:
@@ -170,6 +213,6 @@ class PlayerRepository(BaseRepository[Character]):
         player = self.get(player_id)
         if player:
             player.health = min(player.health + amount, player.max_health)
-            return self.update(player_id, player)
+            return player
         return None
 
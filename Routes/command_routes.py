@@ -1,23 +1,34 @@
 # Command Routes
 # API endpoints for processing general game commands and returning responses
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, g, request
+from Routes.responses import json_response
 from game_engine.engine import game_engine
 
 # Create blueprint
 command_bp = Blueprint('command', __name__)
 
+# Endpoints that need a game in progress
+_REQUIRES_GAME = frozenset({'command.process_command'})
+
+@command_bp.before_request
+def require_game_in_progress():
+    """Reject command requests up front when no game has been started."""
+    if request.endpoint in _REQUIRES_GAME:
+        state = game_engine.game_state
+        if state is None:
+            return json_response({"success": False, "message": "No game in progress."}, 400)
+        g.game_state = state
+
 @command_bp.route('/command', methods=['POST'])
 def process_command():
     """Process a general game command and return the response."""
-    if not game_engine.game_state:
-        return jsonify({"success": False, "message": "No game in progress."}), 400
-    
-    data = request.get_json()
-    command = data.get('command')
+    data = request.get_json(silent=True, cache=True)
+    # A missing, malformed or non-object body has no command either
+    command = data.get('command') if isinstance(data, dict) else None
     if not command:
-        return jsonify({"success": False, "message": "Command is required."}), 400
+        return json_response({"success": False, "message": "Command is required."}, 400)
     
-    # Assuming game_engine has a process_command method that takes a list of words
-    result = game_engine.process_command(command.split())
-    return jsonify(result)
\ No newline at end of file
+    # The engine tokenizes, validates and dispatches the raw string itself
+    result = game_engine.process_command(command)
+    return json_response(result)
\ No newline at end of file
@@ -1,15 +1,37 @@
 # Game Routes
 # API endpoints for game state, navigation, and actions
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, g, request
+from Routes.responses import json_response
 from game_engine.engine import GameEngine, game_engine
-from Repositories.game_state_repository import GameStateRepository
 
 # Create blueprint
 game_bp = Blueprint('game', __name__)
 
-# Global game engine instance (shared with command routes)
-game_state_repo = GameStateRepository()
+# Endpoints that need a game in progress (everything except starting one)
+_REQUIRES_GAME = frozenset({
+    'game.get_game_state',
+    'game.get_current_location',
+    'game.move_player',
+    'game.look_around',
+    'game.get_inventory',
+    'game.get_stats',
+    'game.take_item',
+    'game.drop_item',
+    'game.attack_enemy'
+})
+
+@game_bp.before_request
+def require_game_in_progress():
+    """Reject game requests up front when no game has been started."""
+    if request.endpoint in _REQUIRES_GAME:
+        state = game_engine.game_state
+        if state is None:
+            return json_response({
+                "success": False,
+                "message": "No game in progress. Start a game first."
+            }, 400)
+        g.game_state = state
 
 @game_bp.route('/game/start', methods=['POST'])
 def start_game():
@@ -17,10 +39,10 @@ def start_game():
     # Initialize the game world
     game_engine.initialize_world()
     
-    # Initialize game state repository
-    game_state_repo.initialize_new_game()
+    # Initialize game state repository (one per app, created in create_app)
+    current_app.extensions['game_state_repo'].initialize_new_game()
     
-    return jsonify({
+    return json_response({
         "success": True,
         "message": "Game started!",
         "data": {
@@ -36,15 +58,9 @@ def start_game():
 @game_bp.route('/game/state', methods=['GET'])
 def get_game_state():
     """Get current game state."""
-    if not game_engine.game_state:
-        return jsonify({
-            "success": False,
-            "message": "No game in progress. Start a game first."
-        }), 400
-    
-    state = game_engine.game_state
+    state = g.game_state
     
-    return jsonify({
+    return json_response({
         "success": True,
         "data": {
             "player": {
@@ -62,24 +78,18 @@ def get_game_state():
                 "description": state.current_location.description,
                 "exits": list(state.current_location.exits.keys()),
                 "items": state.current_location.items,
-                "enemies": state.current_location.enemies
+                "enemies": state.current_location.enemies.to_list()
             },
-            "inventory": [item.name for item in state.inventory],
+            "inventory": state.inventory_names,
             "game_status": state.game_status,
-            "visited_locations": list(state.visited_locations)
+            "visited_locations": game_engine.visited_location_ids()
         }
     })
 
 @game_bp.route('/game/location', methods=['GET'])
 def get_current_location():
     """Get current location details."""
-    if not game_engine.game_state:
-        return jsonify({
-            "success": False,
-            "message": "No game in progress."
-        }), 400
-    
-    location = game_engine.game_state.current_location
+    location = g.game_state.current_location
     
     # Get item details
     items = []
@@ -93,106 +103,64 @@ def get_current_location():
                 "type": item.item_type
             })
     
-    return jsonify({
+    return json_response({
         "success": True,
         "data": {
             "id": location.entity_id,
             "name": location.name,
             "description": location.description,
-            "exits": location.exits,
+            "exits": dict(location.exits),
             "items": items,
-            "enemies": location.enemies
+            "enemies": location.enemies.to_list()
         }
     })
 
 @game_bp.route('/game/location/<direction>', methods=['POST'])
 def move_player(direction):
     """Move player in a direction."""
-    if not game_engine.game_state:
-        return jsonify({
-            "success": False,
-            "message": "No game in progress."
-        }), 400
-    
-    result = game_engine.handle_move([direction])
+    result = game_engine.handle_move((direction,))
     
     if result.get("success"):
         # Update game state repository
-        game_state_repo.update_location(
-            game_engine.game_state.current_location.entity_id
+        current_app.extensions['game_state_repo'].update_location(
+            g.game_state.current_location.entity_id
         )
     
-    return jsonify(result)
+    return json_response(result)
 
 @game_bp.route('/game/look', methods=['GET'])
 def look_around():
     """Look around the current location."""
-    if not game_engine.game_state:
-        return jsonify({
-            "success": False,
-            "message": "No game in progress."
-        }), 400
-    
     result = game_engine.handle_look()
-    return jsonify(result)
+    return json_response(result)
 
 @game_bp.route('/game/inventory', methods=['GET'])
 def get_inventory():
     """Get player inventory."""
-    if not game_engine.game_state:
-        return jsonify({
-            "success": False,
-            "message": "No game in progress."
-        }), 400
-    
     result = game_engine.handle_inventory()
-    return jsonify(result)
+    return json_response(result)
 
 @game_bp.route('/game/stats', methods=['GET'])
 def get_stats():
     """Get player stats."""
-    if not game_engine.game_state:
-        return jsonify({
-            "success": False,
-            "message": "No game in progress."
-        }), 400
-    
     result = game_engine.handle_stats()
-    return jsonify(result)
+    return json_response(result)
 
 # New action processing endpoints
 @game_bp.route('/game/take/<item_name>', methods=['POST'])
 def take_item(item_name):
     """Take an item from the current location."""
-    if not game_engine.game_state:
-        return jsonify({
-            "success": False,
-            "message": "No game in progress."
-        }), 400
-    
-    result = game_engine.handle_take([item_name])
-    return jsonify(result)
+    result = game_engine.handle_take((item_name,))
+    return json_response(result)
 
 @game_bp.route('/game/drop/<item_name>', methods=['POST'])
 def drop_item(item_name):
     """Drop an item from inventory."""
-    if not game_engine.game_state:
-        return jsonify({
-            "success": False,
-            "message": "No game in progress."
-        }), 400
-    
-    result = game_engine.handle_drop([item_name])
-    return jsonify(result)
+    result = game_engine.handle_drop((item_name,))
+    return json_response(result)
 
 @game_bp.route('/game/attack/<enemy_name>', methods=['POST'])
 def attack_enemy(enemy_name):
     """Attack an enemy in the current location."""
-    if not game_engine.game_state:
-        return jsonify({
-            "success": False,
-            "message": "No game in progress."
-        }), 400
-    
-    result = game_engine.handle_attack([enemy_name])
-    return jsonify(result)
\ No newline at end of file
+    result = game_engine.handle_attack((enemy_name,))
+    return json_response(result)
\ No newline at end of file
@@ -1,31 +1,48 @@
 # Player Routes
 # API endpoints for player creation, updates, stats, and character management
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, g, request
+from Routes.responses import json_response
 from game_engine.engine import game_engine
 
 # Create blueprint
 player_bp = Blueprint('player', __name__)
 
+# Endpoints that need a game in progress (creating a player does not)
+_REQUIRES_GAME = frozenset({
+    'player.update_player',
+    'player.view_player_stats',
+    'player.equip_item'
+})
+
+@player_bp.before_request
+def require_game_in_progress():
+    """Reject player requests up front when no game has been started."""
+    if request.endpoint in _REQUIRES_GAME:
+        state = game_engine.game_state
+        if state is None:
+            return json_response({"success": False, "message": "No game in progress."}, 400)
+        g.game_state = state
+
 @player_bp.route('/player', methods=['POST'])
 def create_player():
     """Create a new player."""
-    data = request.get_json()
-    name = data.get('name')
+    data = request.get_json(silent=True, cache=True)
+    # A missing, malformed or non-object body has no name either
+    name = data.get('name') if isinstance(data, dict) else None
     if not name:
-        return jsonify({"success": False, "message": "Player name is required."}), 400
+        return json_response({"success": False, "message": "Player name is required."}, 400)
     
     # Assuming game_engine has a create_player method
     result = game_engine.create_player(name)
-    return jsonify(result)
+    return json_response(result)
 
 @player_bp.route('/player', methods=['PUT'])
 def update_player():
     """Update player attributes (e.g., name, stats)."""
-    if not game_engine.game_state:
-        return jsonify({"success": False, "message": "No game in progress."}), 400
-    
-    data = request.get_json()
+    data = request.get_json(silent=True, cache=True)
+    if not isinstance(data, dict):
+        return json_response({"success": False, "message": "Request body must be a JSON object."}, 400)
     updates = {}
     if 'name' in data:
         updates['name'] = data['name']
@@ -35,16 +52,13 @@ def update_player():
     
     # Assuming game_engine has an update_player method
     result = game_engine.update_player(updates)
-    return jsonify(result)
+    return json_response(result)
 
 @player_bp.route('/player/stats', methods=['GET'])
 def view_player_stats():
     """View player stats."""
-    if not game_engine.game_state:
-        return jsonify({"success": False, "message": "No game in progress."}), 400
-    
-    player = game_engine.game_state.player
-    return jsonify({
+    player = g.game_state.player
+    return json_response({
         "success": True,
         "data": {
             "name": player.name,
@@ -60,9 +74,6 @@ def view_player_stats():
 @player_bp.route('/player/equip/<item_name>', methods=['POST'])
 def equip_item(item_name):
     """Equip an item from inventory (character management)."""
-    if not game_engine.game_state:
-        return jsonify({"success": False, "message": "No game in progress."}), 400
-    
     # Assuming game_engine has a handle_equip method
-    result = game_engine.handle_equip([item_name])
-    return jsonify(result)
+    result = game_engine.handle_equip((item_name,))
+    return json_response(result)
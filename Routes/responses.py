@@ -0,0 +1,21 @@
+# Response Helpers
+# Shared JSON response builder for all API blueprints
+
+import orjson
+from flask import Response
+
+
+def json_response(payload, status: int = 200) -> Response:
+    """
+    Serialize a payload to a JSON response.
+    
+    Uses orjson (C implementation) instead of jsonify's stdlib json encoder.
+    
+    Args:
+        payload: Dictionary (or list) to send back to the client
+        status: HTTP status code
+        
+    Returns:
+        Flask Response with an application/json body
+    """
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
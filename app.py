@@ -6,6 +6,8 @@ from flask import render_template
 from Routes.game_routes import game_bp
 from Routes.player_routes import player_bp
 from Routes.command_routes import command_bp
+from Repositories.game_state_repository import GameStateRepository
+from game_engine.engine import game_engine
 
 
 
@@ -20,6 +22,10 @@ def create_app(config_name=None):
     app.template_folder = 'templates'  # Folder for HTML templates
     app.static_folder = 'static'       # Folder for CSS/JS files
 
+    # One game state repository per app, shared by every request/blueprint
+    app.extensions['game_state_repo'] = GameStateRepository()
+    # Log game events to stdout only while debugging
+    game_engine.set_verbose(app.config['DEBUG'])
     
     app.register_blueprint(game_bp, url_prefix='/api')
     app.register_blueprint(player_bp, url_prefix='/api')
@@ -7,6 +7,7 @@ class Config:
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
     DEBUG = os.getenv('DEBUG', 'True') == 'True'
     DATA_DIR = os.getenv('DATA_DIR', 'data')
+    MAX_CONTENT_LENGTH = 16 * 1024  # Request bodies are small JSON commands
     
 class DevelopmentConfig(Config):
     DEBUG = True
@@ -1,7 +1,17 @@
 # Command Parser
 # Parses user input into structured commands
 
-from typing import NamedTuple, Dict, List, Optional, Tuple
+import sys
+from collections import deque
+from functools import lru_cache
+from typing import NamedTuple, Deque, Dict, List, Optional, Tuple
+
+from models.location import DIR_IDX
+
+__all__ = ['CommandParser', 'ParsedCommand', 'ParseResult', 'parser']
+
+# Sentinel for dict.get() so a missing command is distinct from any value
+_MISSING = object()
 
 
 class ParsedCommand(NamedTuple):
@@ -10,14 +20,83 @@ class ParsedCommand(NamedTuple):
     
     Attributes:
         command: The main command (e.g., "move", "take")
-        args: List of arguments (e.g., ["north"], ["health_potion"])
+        args: Tuple of arguments (e.g., ("north",), ("health_potion",))
         raw: The original raw input string
     """
     command: str
-    args: list
+    args: tuple
     raw: str
 
 
+class ParseResult(NamedTuple):
+    """
+    ParseResult is the outcome of parsing and validating in one step.
+    
+    Attributes:
+        ok: True if the command is valid
+        command: The main command ("" for empty input)
+        args: Tuple of arguments
+        error: Error message if not ok, None otherwise
+    """
+    ok: bool
+    command: str
+    args: tuple
+    error: Optional[str]
+
+
+@lru_cache(maxsize=512)
+def _parse_input(input_string: str) -> ParsedCommand:
+    """
+    Split raw input into a ParsedCommand.
+    
+    Pure function of the input string, so results are memoized - players
+    repeat the same few commands ("look", "move north", "i") constantly.
+    ParsedCommand is immutable, so sharing cached results is safe.
+    """
+    # Lowercase and split on whitespace in one go. split() with no
+    # separator already drops leading/trailing whitespace, so no strip().
+    # Empty input falls through as the empty command, which validation rejects.
+    parts = input_string.lower().split() or ("",)
+    
+    # First word is the command, the rest are arguments. Known commands are
+    # swapped for their interned name so later compares/lookups hit on identity;
+    # anything else may be an abbreviation ("inv", "att").
+    command = parts[0]
+    known = _INTERN_TABLE.get(command)
+    command = known if known is not None else _expand_abbreviation(command)
+    return ParsedCommand(command, tuple(parts[1:]), input_string)
+
+
+def _build_command_trie(names) -> dict:
+    """
+    Build a character trie over command names.
+    
+    Each node maps a character to its child node. The None key holds the
+    command that prefix leads to, or "" if more than one command shares it.
+    """
+    root = {None: ""}  # The empty prefix matches every command
+    for name in names:
+        node = root
+        for char in name:
+            node = node.setdefault(char, {})
+            node[None] = name if node.get(None, name) == name else ""
+    return root
+
+
+def _expand_abbreviation(token: str) -> str:
+    """
+    Expand a unique command prefix to the full command name.
+    
+    Returns the token unchanged if it is not a prefix of exactly one command.
+    """
+    node = _COMMAND_TRIE
+    for char in token:
+        node = node.get(char)
+        if node is None:
+            return token
+    return node[None] or token
+
+
 class CommandParser:
     """
     CommandParser handles parsing user input into game commands.
@@ -41,9 +120,14 @@ class CommandParser:
     Command aliases:
     - inventory = i
     - stats = s
+    
+    Commands can also be abbreviated to any unique prefix
+    (e.g. "inv" for inventory, "att" for attack).
     """
     
-    # Command definitions: command name -> list of argument names
+    # Command definitions: command name -> list of argument names.
+    # Aliases are first-class entries so parsing needs no alias lookup;
+    # the engine maps them to the same handlers.
     COMMANDS = {
         'move': ['direction'],
         'look': [],
@@ -60,17 +144,28 @@ class CommandParser:
         'load': []
     }
     
-    # Aliases mapping
+    # Aliases mapping (used for help text)
     ALIASES = {
         'i': 'inventory',
         's': 'stats'
     }
     
-    # Valid directions
-    VALID_DIRECTIONS = ['north', 'south', 'east', 'west', 'up', 'down']
+    # Valid directions and their short forms (n, s, e, w, u, d)
+    VALID_DIRECTIONS = frozenset(DIR_IDX)
+    # Pre-joined for error messages (fixed order; sets are unordered)
+    _VALID_DIRECTIONS_STR = 'north, south, east, west, up, down'
+    
+    # Most recent commands kept in history
+    HISTORY_SIZE = 1024
+    
+    # Distinct inputs whose validated result parse_and_validate remembers
+    RESULT_CACHE_SIZE = 512
     
     def __init__(self):
-        self._command_history: List[ParsedCommand] = []
+        # Bounded so long sessions don't grow memory without limit
+        self._command_history: Deque[ParsedCommand] = deque(maxlen=self.HISTORY_SIZE)
+        # Raw input -> (parsed, validated), least recently used evicted first
+        self._validated = lru_cache(maxsize=self.RESULT_CACHE_SIZE)(self._parse_and_check)
     
     def parse(self, input_string: str) -> ParsedCommand:
         """
@@ -82,27 +177,37 @@ class CommandParser:
         Returns:
             ParsedCommand with command, args, and raw input
         """
-        # Store in history
-        self._command_history.append(input_string)
-        
-        # Clean input: strip whitespace and convert to lowercase
-        cleaned = input_string.strip().lower()
+        parsed = _parse_input(input_string)
         
-        # Handle empty input
-        if not cleaned:
-            return ParsedCommand("", [], input_string)
-        
-        # Split into parts
-        parts = cleaned.split()
+        # Store in history
+        self._command_history.append(parsed)
         
-        # First word is the command
-        command = parts[0]
-        args = parts[1:]
+        return parsed
+    
+    def parse_and_validate(self, input_string: str) -> ParseResult:
+        """
+        Parse and validate user input in a single pass.
         
-        # Resolve aliases
-        command = self.ALIASES.get(command, command)
+        Equivalent to parse() followed by validate_command(), but builds a
+        single result object. Results are memoized per input string, so a
+        repeated command skips both parsing and validation.
         
-        return ParsedCommand(command, args, input_string)
+        Args:
+            input_string: The raw user input
+            
+        Returns:
+            ParseResult with the command and args, or an error message
+        """
+        parsed, result = self._validated(input_string)
+        self._command_history.append(parsed)
+        return result
+    
+    def _parse_and_check(self, input_string: str) -> Tuple[ParsedCommand, ParseResult]:
+        """Uncached body of parse_and_validate (memoized by self._validated)."""
+        # Bypass _parse_input's own cache; self._validated already memoizes
+        command, args, _ = parsed = _parse_input.__wrapped__(input_string)
+        error = self._check(command, args)
+        return parsed, ParseResult(error is None, command, args, error)
     
     def validate_command(self, parsed: ParsedCommand) -> Tuple[bool, Optional[str]]:
         """
@@ -114,34 +219,33 @@ class CommandParser:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        command = parsed.command
-        
-        # Check if command exists
-        if command and command not in self.COMMANDS:
-            return False, f"Unknown command: '{command}'. Type 'help' for available commands."
+        error = self._check(parsed.command, parsed.args)
+        return error is None, error
+    
+    def _check(self, command: str, args: tuple) -> Optional[str]:
+        """
+        Check a command and its arguments against COMMANDS.
         
+        Returns:
+            An error message, or None if the command is valid
+        """
         if not command:
-            return False, "Please enter a command."
+            return "Please enter a command."
         
-        # Get expected arguments for this command
-        expected_args = self.COMMANDS.get(command, [])
+        # Single lookup; the sentinel tells "unknown" apart from "no args"
+        expected_args = self.COMMANDS.get(command, _MISSING)
+        if expected_args is _MISSING:
+            return f"Unknown command: '{command}'. Type 'help' for available commands."
         
         # Check argument count
-        if len(parsed.args) < len(expected_args):
-            # Get argument name for error message
-            if expected_args:
-                arg_name = expected_args[len(parsed.args)]
-                return False, f"Missing argument: {arg_name}"
-            else:
-                return False, f"Command '{command}' doesn't take any arguments."
+        if len(args) < len(expected_args):
+            return f"Missing argument: {expected_args[len(args)]}"
         
         # Validate direction for move command
-        if command == 'move':
-            direction = parsed.args[0] if parsed.args else ""
-            if direction not in self.VALID_DIRECTIONS:
-                return False, f"Invalid direction: '{direction}'. Valid: {', '.join(self.VALID_DIRECTIONS)}"
+        if command == 'move' and args[0] not in self.VALID_DIRECTIONS:
+            return f"Invalid direction: '{args[0]}'. Valid: {self._VALID_DIRECTIONS_STR}"
         
-        return True, None
+        return None
     
     def get_available_commands(self) -> Dict[str, List[str]]:
         """
@@ -163,27 +267,14 @@ class CommandParser:
             Help text string
         """
         if command:
-            # Help for specific command
-            if command in self.COMMANDS:
-                args = self.COMMANDS[command]
-                if args:
-                    return f"{command} {' '.join(args)} - Use {command} with {', '.join(args)}"
-                else:
-                    return f"{command} - No arguments needed"
-            elif command in self.ALIASES:
-                real_command = self.ALIASES[command]
-                return f"{command} is an alias for {real_command}"
-            else:
+            # Help for specific command (precomputed at import)
+            help_text = _HELP_BY_COMMAND.get(command)
+            if help_text is None:
                 return f"Unknown command: {command}"
-        else:
-            # General help
-            help_text = "Available commands:\n"
-            for cmd, args in self.COMMANDS.items():
-                if args:
-                    help_text += f"  {cmd} <{', '.join(args)}>\n"
-                else:
-                    help_text += f"  {cmd}\n"
             return help_text
+        else:
+            # General help (precomputed at import)
+            return _FULL_HELP
     
     def get_history(self) -> List[ParsedCommand]:
         """
@@ -192,9 +283,53 @@ class CommandParser:
         Returns:
             List of parsed commands
         """
-        return self._command_history.copy()
+        return list(self._command_history)
+
+
+# Known command name -> its interned string (used by _parse_input)
+_INTERN_TABLE = {name: sys.intern(name) for name in CommandParser.COMMANDS}
+
+# Prefix trie over the real (non-alias) command names, for abbreviations
+_COMMAND_TRIE = _build_command_trie(
+    _INTERN_TABLE[name] for name in CommandParser.COMMANDS
+    if name not in CommandParser.ALIASES
+)
 
+def _build_command_help() -> Dict[str, str]:
+    """Render the help line for every command and alias once."""
+    help_by_command = {}
+    for command, args in CommandParser.COMMANDS.items():
+        if args:
+            help_by_command[command] = f"{command} {' '.join(args)} - Use {command} with {', '.join(args)}"
+        else:
+            help_by_command[command] = f"{command} - No arguments needed"
+    # Aliases are also COMMANDS entries; describe them as aliases instead
+    for alias, real_command in CommandParser.ALIASES.items():
+        help_by_command[alias] = f"{alias} is an alias for {real_command}"
+    return help_by_command
+
+# Command name -> help text for get_command_help()
+_HELP_BY_COMMAND = _build_command_help()
+
+# Full command listing for get_command_help() with no command
+_FULL_HELP = "Available commands:\n" + "".join(
+    f"  {cmd} <{', '.join(args)}>\n" if args else f"  {cmd}\n"
+    for cmd, args in CommandParser.COMMANDS.items()
+)
+
+# Global parser instance, created on first access (see __getattr__)
+_parser: Optional[CommandParser] = None
 
-# Create global parser instance
-parser = CommandParser()
+
+def __getattr__(name: str):
+    """
+    Module attribute hook (PEP 562) that creates the global `parser` lazily,
+    so importing this module for its classes doesn't build an instance.
+    """
+    if name == 'parser':
+        global _parser
+        if _parser is None:
+            _parser = CommandParser()
+        return _parser
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
@@ -1,11 +1,12 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from functools import partial
+from typing import Dict, List, Optional
 import random
 
 # Import models
 from models.character import Character
-from models.location import Location
-from models.item import Item
+from models.location import DIRECTIONS, Location, build_graph, dir_index, shortest_path
+from models.item import CAN_EQUIP, Item
 
 # Import event system
 from game_engine.event_manager import (
@@ -25,37 +26,91 @@ from game_engine.event_manager import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """GameState holds all the information about the current game session."""
     player: Character
     current_location: Location
-    inventory: List[Item] = field(default_factory=list)
+    # Item ID -> quantity held, in pickup order (Items live in items_db)
+    inventory: Dict[str, int] = field(default_factory=dict)
+    # Names of the items in inventory (one per item held), kept in step with
+    # it so state polls don't rebuild the list on every read
+    inventory_names: List[str] = field(default_factory=list)
     game_status: str = 'playing'
-    visited_locations: Set[str] = field(default_factory=set)
+    visited_locations: int = 0  # Bitmask over GameEngine._loc_index
 
 
 class GameEngine:
     """GameEngine is the main controller for the game."""
     
-    def __init__(self):
-        self.event_manager = EventManager()
+    def __init__(self, verbose: bool = False):
+        # verbose attaches the event-logging listeners (see _debug_listeners)
+        self.event_manager = EventManager(verbose=verbose)
         self.game_state: Optional[GameState] = None
         self.world: Dict[str, Location] = {}
+        self._loc_index: Dict[str, int] = {}
+        self._graph = build_graph((), {})
+        # Location ID -> rendered "look" description; dropped when the
+        # location's items or enemies change
+        self._look_cache: Dict[str, str] = {}
         self.items_db: Dict[str, Item] = {}
+        self._item_name_lower: Dict[str, str] = {}
+        self._name_to_id: Dict[str, str] = {}
         
         from game_engine.command_parser import CommandParser
         self.parser = CommandParser()
         
+        # Dispatch table: command name (aliases included) -> handler.
+        # Built once so routing a command is a single dict lookup.
+        self._handlers = {
+            'move': self.handle_move,
+            'look': self.handle_look,
+            'take': self.handle_take,
+            'drop': self.handle_drop,
+            'use': self.handle_use,
+            'inventory': self.handle_inventory,
+            'stats': self.handle_stats,
+            'attack': self.handle_attack,
+            'help': self.handle_help,
+            'save': self.handle_save,
+            'load': self.handle_load
+        }
+        # Aliases reuse the same bound methods as the commands they stand for
+        for alias, command in self.parser.ALIASES.items():
+            self._handlers[alias] = self._handlers[command]
+        # Cover every command the parser accepts, so dispatch never misses
+        for command in self.parser.COMMANDS:
+            if command not in self._handlers:
+                self._handlers[command] = partial(self._handle_not_implemented, command)
+        
         self._setup_event_listeners()
     
     def _setup_event_listeners(self):
         """Set up event listeners for game events."""
-        self.event_manager.subscribe(PLAYER_MOVED, self._on_player_moved)
-        self.event_manager.subscribe(ITEM_PICKED_UP, self._on_item_picked_up)
-        self.event_manager.subscribe(ITEM_DROPPED, self._on_item_dropped)
-        self.event_manager.subscribe(COMBAT_STARTED, self._on_combat_started)
-        self.event_manager.subscribe(COMBAT_ENDED, self._on_combat_ended)
+        # The listeners only log, so they are attached in verbose mode only;
+        # otherwise publish() finds no subscribers and returns immediately.
+        if self.event_manager.verbose:
+            for event_type, callback in self._debug_listeners():
+                self.event_manager.subscribe(event_type, callback)
+    
+    def _debug_listeners(self) -> tuple:
+        """(event type, callback) pairs of the event-logging listeners."""
+        return (
+            (PLAYER_MOVED, self._on_player_moved),
+            (ITEM_PICKED_UP, self._on_item_picked_up),
+            (ITEM_DROPPED, self._on_item_dropped),
+            (COMBAT_STARTED, self._on_combat_started),
+            (COMBAT_ENDED, self._on_combat_ended),
+        )
+    
+    def set_verbose(self, verbose: bool):
+        """Turn event logging on or off."""
+        self.event_manager.verbose = verbose
+        for event_type, callback in self._debug_listeners():
+            if verbose:
+                self.event_manager.subscribe(event_type, callback)
+            else:
+                self.event_manager.unsubscribe(event_type, callback)
     
     def _on_player_moved(self, event):
         print(f"[EVENT] Player moved to: {event.data.get('location', 'unknown')}")
@@ -97,9 +152,9 @@ class GameEngine:
         self.game_state = GameState(
             player=player,
             current_location=start_location,
-            inventory=[],
+            inventory={},
             game_status='playing',
-            visited_locations={'start'}
+            visited_locations=1 << self._loc_index["start"]
         )
         
         # Publish game started event
@@ -109,20 +164,26 @@ class GameEngine:
     
     def _create_items(self):
         """Create all game items."""
+        # Items never change, so a new game keeps the ones already built
+        if self.items_db:
+            return
+        
         items_data = [
-            Item("iron_sword", "Iron Sword", "A sturdy iron sword", "weapon", 10, {"attack": 5}, True),
-            Item("magic_staff", "Magic Staff", "A staff imbued with magical power", "weapon", 50, {"attack": 15}, True),
-            Item("wooden_shield", "Wooden Shield", "A basic wooden shield", "shield", 5, {"defense": 3}, True),
-            Item("health_potion", "Health Potion", "Restores 30 health points", "potion", 10, {"heal": 30}, False),
-            Item("mana_potion", "Mana Potion", "Restores 25 mana points", "potion", 10, {"mana": 25}, False),
-            Item("strength_potion", "Strength Potion", "Temporarily increases strength by 5", "potion", 25, {"strength_boost": 5}, False),
-            Item("gold_coin", "Gold Coin", "A shiny gold coin", "treasure", 1, {}, False),
-            Item("ruby", "Ruby", "A precious red gem", "treasure", 100, {}, False),
-            Item("ancient_scroll", "Ancient Scroll", "Contains mysterious knowledge", "treasure", 50, {}, False),
+            Item("iron_sword", "Iron Sword", "A sturdy iron sword", "weapon", 10, {"attack": 5}, CAN_EQUIP),
+            Item("magic_staff", "Magic Staff", "A staff imbued with magical power", "weapon", 50, {"attack": 15}, CAN_EQUIP),
+            Item("wooden_shield", "Wooden Shield", "A basic wooden shield", "shield", 5, {"defense": 3}, CAN_EQUIP),
+            Item("health_potion", "Health Potion", "Restores 30 health points", "potion", 10, {"heal": 30}, 0),
+            Item("mana_potion", "Mana Potion", "Restores 25 mana points", "potion", 10, {"mana": 25}, 0),
+            Item("strength_potion", "Strength Potion", "Temporarily increases strength by 5", "potion", 25, {"strength_boost": 5}, 0),
+            Item("gold_coin", "Gold Coin", "A shiny gold coin", "treasure", 1, {}, 0),
+            Item("ruby", "Ruby", "A precious red gem", "treasure", 100, {}, 0),
+            Item("ancient_scroll", "Ancient Scroll", "Contains mysterious knowledge", "treasure", 50, {}, 0),
         ]
         
         for item in items_data:
             self.items_db[item.entity_id] = item
+            self._item_name_lower[item.entity_id] = item.name.lower()
+            self._name_to_id[item.name.lower()] = item.entity_id
     
     def _create_locations(self):
         """Create all game world locations."""
@@ -205,75 +266,120 @@ class GameEngine:
             "cave": cave,
             "treasure_room": treasure_room
         }
+        
+        self._look_cache.clear()
+        
+        # Location ID -> bit index in GameState.visited_locations
+        self._loc_index = {location_id: i for i, location_id in enumerate(self.world)}
+        # Exits as a CSR graph over the same numbering, for pathfinding
+        self._graph = build_graph(self.world.values(), self._loc_index)
+    
+    def path_to(self, location_id: str) -> Optional[List[str]]:
+        """Get the shortest list of location IDs from here to a location."""
+        goal = self._loc_index.get(location_id)
+        if goal is None:
+            return None
+        start = self._loc_index[self.game_state.current_location.entity_id]
+        path = shortest_path(*self._graph, start, goal)
+        if path is None:
+            return None
+        location_ids = list(self._loc_index)
+        return [location_ids[i] for i in path]
+    
+    def visited_location_ids(self) -> List[str]:
+        """Get the IDs of all locations the player has visited."""
+        mask = self.game_state.visited_locations
+        return [location_id for location_id, i in self._loc_index.items() if mask >> i & 1]
     
     def process_command(self, input_string: str) -> dict:
         """Process a player command."""
         if not self.game_state:
-            return {"success": False, "message": "Game not initialized. Call initialize_world() first."}
-        
-        # Parse the command
-        parsed = self.parser.parse(input_string)
+            return self._err("Game not initialized. Call initialize_world() first.")
         
-        # Validate command
-        is_valid, error_msg = self.parser.validate_command(parsed)
-        if not is_valid:
-            return {"success": False, "message": error_msg}
+        # Parse and validate the command in one pass
+        parsed = self.parser.parse_and_validate(input_string)
+        if not parsed.ok:
+            return self._err(parsed.error)
         
-        # Route to appropriate handler
-        command = parsed.command
-        args = parsed.args
-        
-        handlers = {
-            'move': self.handle_move,
-            'look': self.handle_look,
-            'take': self.handle_take,
-            'drop': self.handle_drop,
-            'use': self.handle_use,
-            'inventory': self.handle_inventory,
-            'stats': self.handle_stats,
-            'attack': self.handle_attack,
-            'help': self.handle_help,
-            'save': self.handle_save,
-            'load': self.handle_load
-        }
+        # Route to appropriate handler; valid commands always have one
+        return self._handlers[parsed.command](parsed.args)
+    
+    def _handle_not_implemented(self, command: str, args: tuple) -> dict:
+        """Fallback handler for parser commands the engine doesn't support."""
+        return self._err(f"Command '{command}' not implemented yet.")
+    
+    # ==================== RESULT HELPERS ====================
+    
+    def _ok(self, message: str, data: dict = None) -> dict:
+        """Build a success result with an optional data payload."""
+        if data is None:
+            return {"success": True, "message": message}
+        return {"success": True, "message": message, "data": data}
+    
+    def _err(self, message: str) -> dict:
+        """Build a failure result."""
+        return {"success": False, "message": message}
+    
+    # ==================== INVENTORY HELPERS ====================
+    
+    def _find_in_inventory(self, item_name: str) -> Optional[str]:
+        """Find the ID of an inventory item by its ID or (partial) name."""
+        inventory = self.game_state.inventory
         
-        handler = handlers.get(command)
-        if handler:
-            return handler(args)
+        # An exact ID or full name is a single hashed lookup
+        if item_name in inventory:
+            return item_name
+        item_id = self._name_to_id.get(item_name)
+        if item_id in inventory:
+            return item_id
+        
+        names = self._item_name_lower
+        for item_id in inventory:
+            if item_name in names[item_id] or item_name in item_id:
+                return item_id
+        return None
+    
+    def _remove_from_inventory(self, item: Item):
+        """Take one of an item out of the inventory."""
+        inventory = self.game_state.inventory
+        count = inventory[item.entity_id] - 1
+        if count:
+            inventory[item.entity_id] = count
         else:
-            return {"success": False, "message": f"Command '{command}' not implemented yet."}
+            del inventory[item.entity_id]
+        self.game_state.inventory_names.remove(item.name)
     
     # ==================== COMMAND HANDLERS ====================
     
-    def handle_move(self, args: list) -> dict:
+    def handle_move(self, args: tuple) -> dict:
         """Handle player movement."""
         if not args:
-            return {"success": False, "message": "Move where? Specify a direction (north, south, east, west)."}
+            return self._err("Move where? Specify a direction (north, south, east, west).")
         
         direction = args[0].lower()
         current_loc = self.game_state.current_location
         
-        # Check if direction exists
-        if direction not in current_loc.exits:
-            return {"success": False, "message": f"You can't go {direction}. Available exits: {', '.join(current_loc.exits.keys())}"}
-        
-        # Get new location ID
-        new_location_id = current_loc.exits[direction]
+        # Map the direction (or its short form) to an exit slot
+        idx = dir_index(direction)
+        new_location_id = current_loc.exits_v[idx] if idx is not None else None
+        if new_location_id is None:
+            return self._err(f"You can't go {direction}. Available exits: {current_loc.exits_str}")
+        direction = DIRECTIONS[idx]
         
         # Check if location exists
         if new_location_id not in self.world:
-            return {"success": False, "message": "Something went wrong. That location doesn't exist."}
+            return self._err("Something went wrong. That location doesn't exist.")
         
         # Get new location
         new_location = self.world[new_location_id]
         
         # Check if location is locked
         if new_location.is_locked:
-            return {"success": False, "message": f"The {new_location.name} is locked. You need a key."}
+            return self._err(f"The {new_location.name} is locked. You need a key.")
         
         # Update player location
         self.game_state.current_location = new_location
-        self.game_state.visited_locations.add(new_location_id)
+        self.game_state.visited_locations |= 1 << self._loc_index[new_location_id]
         
         # Publish event
         self.event_manager.publish(PLAYER_MOVED, {
@@ -281,21 +387,23 @@ class GameEngine:
             "direction": direction
         })
         
-        return {
-            "success": True, 
-            "message": f"You head {direction}...\n\n{new_location.name}\n{new_location.description}",
-            "data": {"location": new_location_id, "exits": list(new_location.exits.keys())}
-        }
+        return self._ok(
+            f"You head {direction}...\n\n{new_location.name}\n{new_location.description}",
+            {"location": new_location_id, "exits": list(new_location.exits.keys())}
+        )
     
-    def handle_look(self, args: list = None) -> dict:
+    def handle_look(self, args: tuple = None) -> dict:
         """Describe the current location."""
         location = self.game_state.current_location
         
+        description = self._look_cache.get(location.entity_id)
+        if description is not None:
+            return self._ok(description)
+        
         description = f"\n=== {location.name} ===\n\n{location.description}\n"
         
         if location.exits:
-            exits_str = ", ".join(location.exits.keys())
-            description += f"\nExits: {exits_str}"
+            description += f"\nExits: {location.exits_str}"
         
         if location.items:
             items_in_location = [self.items_db[item_id].name for item_id in location.items if item_id in self.items_db]
@@ -303,37 +411,40 @@ class GameEngine:
                 description += f"\n\nYou see: {', '.join(items_in_location)}"
         
         if location.enemies:
-            enemy_names = [e["name"] for e in location.enemies]
-            description += f"\n\n⚔️ DANGER! Enemies here: {', '.join(enemy_names)}"
+            description += f"\n\n⚔️ DANGER! Enemies here: {', '.join(location.enemies.names)}"
         
-        return {"success": True, "message": description}
+        self._look_cache[location.entity_id] = description
+        return self._ok(description)
     
-    def handle_take(self, args: list) -> dict:
+    def handle_take(self, args: tuple) -> dict:
         """Pick up an item from the current location."""
         if not args:
-            return {"success": False, "message": "Take what? Specify an item name."}
+            return self._err("Take what? Specify an item name.")
         
         item_name = " ".join(args).lower()
         location = self.game_state.current_location
         
         # Find item in location
         found_item_id = None
+        names = self._item_name_lower
         for item_id in location.items:
-            if item_id in self.items_db:
-                item = self.items_db[item_id]
-                if item_name in item.name.lower() or item_name in item_id.lower():
-                    found_item_id = item_id
-                    break
+            name = names.get(item_id)
+            if name is not None and (item_name in name or item_name in item_id):
+                found_item_id = item_id
+                break
         
         if not found_item_id:
-            return {"success": False, "message": f"There's no '{item_name}' here."}
+            return self._err(f"There's no '{item_name}' here.")
         
         # Remove from location
         location.items.remove(found_item_id)
+        self._look_cache.pop(location.entity_id, None)
         
         # Add to inventory
         item = self.items_db[found_item_id]
-        self.game_state.inventory.append(item)
+        inventory = self.game_state.inventory
+        inventory[found_item_id] = inventory.get(found_item_id, 0) + 1
+        self.game_state.inventory_names.append(item.name)
         
         # Publish event
         self.event_manager.publish(ITEM_PICKED_UP, {
@@ -341,36 +452,31 @@ class GameEngine:
             "item_id": found_item_id
         })
         
-        return {
-            "success": True,
-            "message": f"You pick up the {item.name}. {item.description}",
-            "data": {"item": item.name}
-        }
+        return self._ok(
+            f"You pick up the {item.name}. {item.description}",
+            {"item": item.name}
+        )
     
-    def handle_drop(self, args: list) -> dict:
+    def handle_drop(self, args: tuple) -> dict:
         """Drop an item from inventory to the current location."""
         if not args:
-            return {"success": False, "message": "Drop what? Specify an item name."}
+            return self._err("Drop what? Specify an item name.")
         
         item_name = " ".join(args).lower()
         
         # Find item in inventory
-        found_item = None
-        found_index = None
-        for i, item in enumerate(self.game_state.inventory):
-            if item_name in item.name.lower() or item_name in item.entity_id.lower():
-                found_item = item
-                found_index = i
-                break
-        
-        if not found_item:
-            return {"success": False, "message": f"You don't have a '{item_name}' in your inventory."}
+        found_item_id = self._find_in_inventory(item_name)
+        if not found_item_id:
+            return self._err(f"You don't have a '{item_name}' in your inventory.")
         
         # Remove from inventory
-        self.game_state.inventory.pop(found_index)
+        found_item = self.items_db[found_item_id]
+        self._remove_from_inventory(found_item)
         
         # Add to location
-        self.game_state.current_location.items.append(found_item.entity_id)
+        location = self.game_state.current_location
+        location.items.append(found_item.entity_id)
+        self._look_cache.pop(location.entity_id, None)
         
         # Publish event
         self.event_manager.publish(ITEM_DROPPED, {
@@ -378,37 +484,30 @@ class GameEngine:
             "item_id": found_item.entity_id
         })
         
-        return {
-            "success": True,
-            "message": f"You drop the {found_item.name}.",
-            "data": {"item": found_item.name}
-        }
+        return self._ok(
+            f"You drop the {found_item.name}.",
+            {"item": found_item.name}
+        )
     
-    def handle_use(self, args: list) -> dict:
+    def handle_use(self, args: tuple) -> dict:
         """Use an item from inventory."""
         if not args:
-            return {"success": False, "message": "Use what? Specify an item name."}
+            return self._err("Use what? Specify an item name.")
         
         item_name = " ".join(args).lower()
         
         # Find item in inventory
-        found_item = None
-        found_index = None
-        for i, item in enumerate(self.game_state.inventory):
-            if item_name in item.name.lower() or item_name in item.entity_id.lower():
-                found_item = item
-                found_index = i
-                break
-        
-        if not found_item:
-            return {"success": False, "message": f"You don't have a '{item_name}' in your inventory."}
+        found_item_id = self._find_in_inventory(item_name)
+        if not found_item_id:
+            return self._err(f"You don't have a '{item_name}' in your inventory.")
+        found_item = self.items_db[found_item_id]
         
         # Apply item effects
         player = self.game_state.player
         effect = found_item.effect or {}
         
         if not effect:
-            return {"success": False, "message": f"The {found_item.name} can't be used."}
+            return self._err(f"The {found_item.name} can't be used.")
         
         messages = []
         
@@ -434,7 +533,7 @@ class GameEngine:
         
         # Consume one-time use items
         if found_item.item_type in ["potion", "treasure"]:
-            self.game_state.inventory.pop(found_index)
+            self._remove_from_inventory(found_item)
             messages.append(f"(The {found_item.name} has been used up.)")
         
         # Publish event
@@ -443,32 +542,32 @@ class GameEngine:
             "effect": effect
         })
         
-        return {
-            "success": True,
-            "message": "\n".join(messages),
-            "data": {"item": found_item.name, "effect": effect}
-        }
+        return self._ok(
+            "\n".join(messages),
+            {"item": found_item.name, "effect": effect}
+        )
     
-    def handle_inventory(self, args: list = None) -> dict:
+    def handle_inventory(self, args: tuple = None) -> dict:
         """Show player inventory."""
         inventory = self.game_state.inventory
         
         if not inventory:
-            return {"success": True, "message": "Your inventory is empty."}
+            return self._ok("Your inventory is empty.")
         
         items_list = []
-        for item in inventory:
-            items_list.append(f"  - {item.name}: {item.description} (Value: {item.value})")
+        for item_id, count in inventory.items():
+            item = self.items_db[item_id]
+            quantity = f" x{count}" if count > 1 else ""
+            items_list.append(f"  - {item.name}{quantity}: {item.description} (Value: {item.value})")
         
         message = "=== Your Inventory ===\n\n" + "\n".join(items_list)
         
-        return {
-            "success": True,
-            "message": message,
-            "data": {"items": [item.name for item in inventory]}
-        }
+        return self._ok(
+            message,
+            {"items": list(self.game_state.inventory_names)}
+        )
     
-    def handle_stats(self, args: list = None) -> dict:
+    def handle_stats(self, args: tuple = None) -> dict:
         """Show player statistics."""
         player = self.game_state.player
         
@@ -481,13 +580,12 @@ Level: {player.level}
 Experience: {player.experience}
 
 Location: {self.game_state.current_location.name}
-Inventory: {len(self.game_state.inventory)} items
-Visited: {len(self.game_state.visited_locations)} locations"""
+Inventory: {len(self.game_state.inventory_names)} items
+Visited: {self.game_state.visited_locations.bit_count()} locations"""
         
-        return {
-            "success": True,
-            "message": message,
-            "data": {
+        return self._ok(
+            message,
+            {
                 "health": player.health,
                 "max_health": player.max_health,
                 "mana": player.mana,
@@ -495,101 +593,102 @@ Visited: {len(self.game_state.visited_locations)} locations"""
                 "level": player.level,
                 "experience": player.experience
             }
-        }
+        )
     
-    def handle_attack(self, args: list) -> dict:
+    def handle_attack(self, args: tuple) -> dict:
         """Handle combat - attack an enemy."""
         if not args:
-            return {"success": False, "message": "Attack what? Specify an enemy."}
+            return self._err("Attack what? Specify an enemy.")
         
         target_name = " ".join(args).lower()
         location = self.game_state.current_location
         
         # Find enemy in location
-        target_enemy = None
-        for enemy in location.enemies:
-            if target_name in enemy["name"].lower():
-                target_enemy = enemy
-                break
-        
-        if not target_enemy:
-            return {"success": False, "message": f"There's no {target_name} here to attack."}
+        enemies = location.enemies
+        index = enemies.find(target_name)
+        if index < 0:
+            return self._err(f"There's no {target_name} here to attack.")
+        enemy_name = enemies.names[index]
         
         # Combat!
         player = self.game_state.player
         
         # Player attacks
         damage_dealt = random.randint(player.strength - 2, player.strength + 3)
-        target_enemy["health"] -= damage_dealt
+        enemies.health[index] -= damage_dealt
+        enemy_health = enemies.health[index]
         
         # Publish event
         self.event_manager.publish(ENEMY_DAMAGED, {
-            "enemy": target_enemy["name"],
+            "enemy": enemy_name,
             "damage": damage_dealt
         })
         
-        message = f"You attack the {target_enemy['name']} for {damage_dealt} damage!"
+        message = f"You attack the {enemy_name} for {damage_dealt} damage!"
         
         # Check if enemy defeated
-        if target_enemy["health"] <= 0:
-            message += f"\n\n🎉 You defeated the {target_enemy['name']}!"
+        if enemy_health <= 0:
+            message += f"\n\n🎉 You defeated the {enemy_name}!"
             
             # Remove enemy from location
-            location.enemies.remove(target_enemy)
+            enemies.remove(index)
+            self._look_cache.pop(location.entity_id, None)
             
             # Award experience
             exp_gain = random.randint(15, 30)
             player.experience += exp_gain
             message += f"\nYou gain {exp_gain} experience!"
             
-            # Check for level up
-            new_level = (player.experience // 100) + 1
-            if new_level > player.level:
-                player.level = new_level
+            # Check for level up: level N ends at N * 100 experience.
+            # Loop so a big award grants every level (and bonus) it covers.
+            leveled_up = False
+            while player.experience >= player.level * 100:
+                player.level += 1
                 player.max_health += 10
-                player.health = player.max_health
                 player.strength += 2
+                leveled_up = True
+                self.event_manager.publish(LEVEL_UP, {"level": player.level})
+            if leveled_up:
+                player.health = player.max_health
                 message += f"\n\n🎊 LEVEL UP! You are now level {player.level}!"
-                self.event_manager.publish(LEVEL_UP, {"level": new_level})
             
             self.event_manager.publish(ENEMY_DEFEATED, {
-                "enemy": target_enemy["name"],
+                "enemy": enemy_name,
                 "experience": exp_gain
             })
             
-            if not location.enemies:
+            if not enemies:
                 message += "\n\nAll enemies defeated! The area is now safe."
                 self.event_manager.publish(COMBAT_ENDED, {
                     "result": "victory",
-                    "location": location.id
+                    "location": location.entity_id
                 })
         else:
             # Enemy counter-attacks
-            enemy_damage = target_enemy.get("damage", 5)
+            enemy_damage = enemies.damage[index]
             player.health -= enemy_damage
-            message += f"\nThe {target_enemy['name']} attacks you for {enemy_damage} damage!"
+            message += f"\nThe {enemy_name} attacks you for {enemy_damage} damage!"
             
             self.event_manager.publish(PLAYER_DAMAGED, {
                 "damage": enemy_damage,
-                "enemy": target_enemy["name"]
+                "enemy": enemy_name
             })
             
             if player.health <= 0:
                 message += "\n\n💀 You have been defeated! Game Over."
                 self.game_state.game_status = "game_over"
         
-        return {
-            "success": True,
-            "message": message,
-            "data": {"enemy_health": target_enemy.get("health", 0)}
-        }
+        return self._ok(
+            message,
+            {"enemy_health": enemy_health}
+        )
     
-    def handle_help(self, args: list = None) -> dict:
+    def handle_help(self, args: tuple = None) -> dict:
         """Show available commands."""
         if args:
             command = args[0].lower()
             help_text = self.parser.get_command_help(command)
-            return {"success": True, "message": help_text}
+            return self._ok(help_text)
         
         help_text = """=== Available Commands ===
 
@@ -621,15 +720,15 @@ Examples:
   attack goblin
   stats
 """
-        return {"success": True, "message": help_text}
+        return self._ok(help_text)
     
-    def handle_save(self, args: list = None) -> dict:
+    def handle_save(self, args: tuple = None) -> dict:
         """Save the game."""
-        return {"success": True, "message": "Game saved! (Demo - not persisted to disk)"}
+        return self._ok("Game saved! (Demo - not persisted to disk)")
     
-    def handle_load(self, args: list = None) -> dict:
+    def handle_load(self, args: tuple = None) -> dict:
         """Load a saved game."""
-        return {"success": True, "message": "No saved games found. Start a new game!"}
+        return self._ok("No saved games found. Start a new game!")
 
 
 # Global game engine instance
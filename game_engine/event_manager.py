@@ -1,9 +1,11 @@
 # Event Manager
 # Handles game events and event-driven communication
 
-from typing import Callable, Dict, List
-from dataclasses import dataclass
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Tuple, Union
+from dataclasses import dataclass, field, InitVar
 from datetime import datetime
+import time
 
 # Event Type Constants
 # These define all possible events in our game
@@ -33,15 +35,30 @@ class GameEvent:
     Attributes:
         type: The type of event (e.g., "player_moved")
         data: Dictionary containing event-specific data
-        timestamp: When the event occurred
+        timestamp_ns: When the event occurred, in nanoseconds since the epoch
+    
+    The timestamp argument (a datetime or seconds since the epoch) is still
+    accepted and converted; reading event.timestamp gives a datetime.
     """
     type: str
     data: dict
-    timestamp: datetime = None
+    timestamp: InitVar[Union[datetime, float, None]] = None
+    timestamp_ns: int = field(default_factory=time.time_ns)
     
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+    def __post_init__(self, timestamp):
+        if timestamp is not None:
+            if isinstance(timestamp, datetime):
+                timestamp = timestamp.timestamp()
+            self.timestamp_ns = round(timestamp * 1_000_000_000)
+
+
+def _event_timestamp(self) -> datetime:
+    """When the event occurred, as a datetime (built on access)."""
+    return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+
+# Attached after the class so the dataclass sees timestamp as the InitVar
+# above rather than as a property
+GameEvent.timestamp = property(_event_timestamp)
 
 
 class EventManager:
@@ -67,10 +84,16 @@ class EventManager:
         event_manager.publish(PLAYER_MOVED, {"location": "forest"})
     """
     
-    def __init__(self):
-        # Dictionary to store event type -> list of callbacks
-        # Example: {"player_moved": [callback1, callback2]}
-        self._events: Dict[str, List[Callable]] = {}
+    def __init__(self, verbose: bool = False):
+        # Whether debug listeners (that just log events) should be attached
+        self.verbose = verbose
+        # Dictionary to store event type -> callbacks, as an insertion-ordered
+        # dict used as a set (values are always None)
+        # Example: {"player_moved": {callback1: None, callback2: None}}
+        self._events: Dict[str, Dict[Callable, None]] = {}
+        # Events published from inside a callback, drained by the outer publish
+        self._queue: Deque[Tuple[str, dict]] = deque()
+        self._pumping = False
     
     def subscribe(self, event_type: str, callback: Callable) -> bool:
         """
@@ -83,14 +106,12 @@ class EventManager:
         Returns:
             True if subscribed successfully
         """
-        if event_type not in self._events:
-            self._events[event_type] = []
-        
         # Don't add duplicate callbacks
-        if callback not in self._events[event_type]:
-            self._events[event_type].append(callback)
-            return True
-        return False
+        subscribers = self._events.get(event_type)
+        if subscribers is not None and callback in subscribers:
+            return False
+        self._writable_subscribers(event_type)[callback] = None
+        return True
     
     def unsubscribe(self, event_type: str, callback: Callable) -> bool:
         """
@@ -103,37 +124,79 @@ class EventManager:
         Returns:
             True if unsubscribed successfully
         """
-        if event_type in self._events:
-            if callback in self._events[event_type]:
-                self._events[event_type].remove(callback)
-                return True
-        return False
+        subscribers = self._events.get(event_type)
+        if subscribers is None or callback not in subscribers:
+            return False
+        del self._writable_subscribers(event_type)[callback]
+        return True
+    
+    def _writable_subscribers(self, event_type: str) -> Dict[Callable, None]:
+        """
+        Get the callbacks of an event type for modification.
+        
+        While events are being dispatched, the dict is copied first so a
+        callback that (un)subscribes doesn't resize the dict being iterated.
+        """
+        subscribers = self._events.get(event_type)
+        if subscribers is None:
+            subscribers = self._events[event_type] = {}
+        elif self._pumping:
+            subscribers = self._events[event_type] = dict(subscribers)
+        return subscribers
     
-    def publish(self, event_type: str, data: dict = None) -> GameEvent:
+    def publish(self, event_type: str, data: dict = None) -> Optional[GameEvent]:
         """
         Publish an event to all subscribers.
         
+        Events published from inside a callback are queued and delivered
+        in order once the current event finishes, rather than recursively.
+        
         Args:
             event_type: The type of event to publish
             data: Dictionary of event data
             
         Returns:
-            The created GameEvent object
+            The created GameEvent object, or None if nobody is subscribed
+            or the event was queued behind one already being dispatched
         """
+        # Nobody listening: skip building the event entirely
+        subscribers = self._events.get(event_type)
+        if not subscribers:
+            return None
+        
         # Create the event with data (default to empty dict)
         if data is None:
             data = {}
         
+        # Nested publish: let the outer call deliver it
+        if self._pumping:
+            self._queue.append((event_type, data))
+            return None
+        
+        self._pumping = True
+        try:
+            event = self._dispatch(event_type, data, subscribers)
+            queue = self._queue
+            while queue:
+                queued_type, queued_data = queue.popleft()
+                queued_subscribers = self._events.get(queued_type)
+                if queued_subscribers:
+                    self._dispatch(queued_type, queued_data, queued_subscribers)
+        finally:
+            self._pumping = False
+        return event
+    
+    def _dispatch(self, event_type: str, data: dict, subscribers: Dict[Callable, None]) -> GameEvent:
+        """Deliver a single event to its subscribers."""
         event = GameEvent(type=event_type, data=data)
         
         # Notify all subscribers
-        if event_type in self._events:
-            for callback in self._events[event_type]:
-                try:
-                    callback(event)
-                except Exception as e:
-                    # Log error but don't stop processing other callbacks
-                    print(f"Error in event callback: {e}")
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception as e:
+                # Log error but don't stop processing other callbacks
+                print(f"Error in event callback: {e}")
         
         return event
     
@@ -147,7 +210,7 @@ class EventManager:
         """
         if event_type:
             if event_type in self._events:
-                self._events[event_type] = []
+                self._events[event_type] = {}
         else:
             self._events.clear()
     
@@ -161,7 +224,7 @@ class EventManager:
         Returns:
             Number of subscribers
         """
-        return len(self._events.get(event_type, []))
+        return len(self._events.get(event_type, ()))
 
 
 # Global event manager instance
@@ -4,6 +4,7 @@
 from models.entity import Entity
 from models.character import Character
 from models.item import Item
-from models.location import Location
+from models.location import Location, Direction
+from models.enemy_table import EnemyTable
 
-__all__ = ['Entity', 'Character', 'Item', 'Location']
+__all__ = ['Entity', 'Character', 'Item', 'Location', 'Direction', 'EnemyTable']
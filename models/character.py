@@ -2,10 +2,11 @@
 from models.entity import Entity 
 
 class Character(Entity):
-    max_health = 100 # class variable
+    __slots__ = ('health', 'mana', 'strength', 'level', 'experience', 'max_health')
 
-    def __init__(self,id,name,description,health,mana,strength,level,experience):
+    def __init__(self,id,name,description,health,mana,strength,level,experience,max_health=100):
         super().__init__(id,name, description)
+        self.max_health = max_health # per character, grows on level up
         self.health = health # Instance variable
         self.mana = mana
         self.strength = strength
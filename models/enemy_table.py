@@ -0,0 +1,46 @@
+# the enemies in a location, stored column-wise (one list per field)
+from array import array
+
+class EnemyTable:
+    __slots__ = ('ids', 'names', 'names_lower', 'health', 'damage')
+
+    def __init__(self, enemies=()):
+        self.ids = []
+        self.names = []
+        self.names_lower = [] # lowered once here so find() doesn't on every attack
+        self.health = array('i')
+        self.damage = array('i')
+        for enemy in enemies:
+            self.add(enemy["id"], enemy["name"], enemy["health"], enemy.get("damage", 5))
+
+    def add(self, id, name, health, damage):
+        self.ids.append(id)
+        self.names.append(name)
+        self.names_lower.append(name.lower())
+        self.health.append(health)
+        self.damage.append(damage)
+
+    def remove(self, index):
+        # drop one enemy from every column
+        del self.ids[index]
+        del self.names[index]
+        del self.names_lower[index]
+        del self.health[index]
+        del self.damage[index]
+
+    def find(self, name):
+        # index of the first enemy whose name contains `name` (lowercase), or -1
+        for i, enemy_name in enumerate(self.names_lower):
+            if name in enemy_name:
+                return i
+        return -1
+
+    def to_list(self):
+        # JSON-friendly rows, same shape the enemies were defined with
+        return [
+            {"id": id, "name": name, "health": health, "damage": damage}
+            for id, name, health, damage in zip(self.ids, self.names, self.health, self.damage)
+        ]
+
+    def __len__(self):
+        return len(self.ids)
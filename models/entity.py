@@ -1,7 +1,11 @@
 # entity is the parent class for all game object(chatacter,item,location)
+import sys
+
 class Entity:
+    __slots__ = ('entity_id', 'name', 'description')
+
     def __init__(self,id,name,description):
-        self.entity_id = id
+        self.entity_id = sys.intern(id) # ids are dict keys everywhere; share one object
         self.name = name
         self.description = description
 # all game objects should have properties like name and description
\ No newline at end of file
@@ -1,27 +1,72 @@
 # something the player can pick up, use, or equip
+# items never change once created, so one instance per id is shared everywhere
+import sys
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from models.entity import Entity 
 
+# bits of Item.flags
+CAN_EQUIP = 1
+STACKABLE = 2
+CONSUMABLE = 4
+
+@dataclass(frozen=True, slots=True, eq=False)
 class Item(Entity):
-    def __init__(self,id,name,description,item_type,value,effect,can_equip):
-        super().__init__(id,name,description)
-        self.item_type = item_type
-        self.value = value
-        self.effect = effect
-        self.can_equip = can_equip
-
-# Pre-defined items
-WEAPONS = {
-    "iron_sword": {"name": "Iron Sword", "value": 10, "effect": "+5 attack"},
-    "magic_staff": {"name": "Magic Staff", "value": 50, "effect": "+20 magic"}
-}
-POTIONS = {
-    "health_potion": {"name": "Health Potion"},
-    "mana_potion": {"name": "Mana Potion"}
-}
+    entity_id: str
+    name: str
+    description: str
+    item_type: str
+    value: int
+    effect: dict | str # engine items: stat dict ({"heal": 30}); create_item: text ("+5 attack")
+    flags: int # CAN_EQUIP | STACKABLE | CONSUMABLE
+
+    @property
+    def can_equip(self):
+        return bool(self.flags & CAN_EQUIP)
+
+# Pre-defined items (read-only views: these tables never change at runtime)
+WEAPONS = MappingProxyType({
+    "iron_sword": MappingProxyType({"name": "Iron Sword", "value": 10, "effect": "+5 attack"}),
+    "magic_staff": MappingProxyType({"name": "Magic Staff", "value": 50, "effect": "+20 magic"})
+})
+POTIONS = MappingProxyType({
+    "health_potion": MappingProxyType({"name": "Health Potion"}),
+    "mana_potion": MappingProxyType({"name": "Mana Potion"})
+})
+
+# every pre-defined item in one table, so create_item does a single lookup
+ITEM_REGISTRY = MappingProxyType({**WEAPONS, **POTIONS})
+
+# the registry again, column-wise, for bulk queries over every item type;
+# row i of each column describes ITEM_IDS[i]
+ITEM_IDS = tuple(ITEM_REGISTRY)
+ITEM_NAMES = tuple(data["name"] for data in ITEM_REGISTRY.values())
+ITEM_VALUES = array('i', (data.get("value", 0) for data in ITEM_REGISTRY.values()))
+ITEM_EFFECTS = tuple(data.get("effect", "") for data in ITEM_REGISTRY.values())
+ITEM_INDEX = {item_type: i for i, item_type in enumerate(ITEM_IDS)}
+
+# item types worth less than `limit`, scanning only the value column
+def item_types_below(limit):
+    return [ITEM_IDS[i] for i, value in enumerate(ITEM_VALUES) if value < limit]
+
+# a ready-made Item per registry entry, so spawning one just copies its fields
+_PROTOTYPES = MappingProxyType({
+    item_type: Item(item_type, data["name"], data.get("description", ""), item_type,
+                    data.get("value", 0), data.get("effect", ""), CAN_EQUIP)
+    for item_type, data in ITEM_REGISTRY.items()
+})
+_BLANK = Item("", "", "", "", 0, "", CAN_EQUIP) # prototype for unknown types
 
 # Create item by name
+# items are frozen, so repeat calls share one cached instance; the cache is
+# bounded so spawning many distinct ids doesn't grow memory without limit
+@lru_cache(maxsize=1024)
 def create_item(item_id, item_type, name):
-    data = WEAPONS.get(item_type, {}) # <- looks up in dictionary
-    data = POTIONS.get(item_type, {})
-    return Item(item_id, name, data.get("description", ""), item_type, 
-                data.get("value", 0), data.get("effect", ""), True)
+    # ids and types come from callers at runtime; intern them like the literals
+    item_id = sys.intern(item_id)
+    item_type = sys.intern(item_type)
+    proto = _PROTOTYPES.get(item_type, _BLANK) # <- looks up in dictionary
+    return Item(item_id, name, proto.description, item_type, 
+                proto.value, proto.effect, proto.flags)
@@ -1,10 +1,131 @@
 # A place in the game world(room,forest,city)
+import sys
+from array import array
+from collections import deque
+from enum import IntEnum
+from types import MappingProxyType
+from hashlib import blake2b
 from models.entity import Entity 
+from models.enemy_table import EnemyTable
+
+__all__ = ['Location', 'Direction', 'DIRECTIONS', 'DIR_IDX', 'dir_index', 'LOCKED', 'zobrist_key', 'state_hash',
+           'build_graph', 'shortest_path']
+
+# bits of Location.flags
+LOCKED = 1
+
+# exit slots; loc.exits_v[Direction.NORTH] is the location to the north
+class Direction(IntEnum):
+    NORTH = 0
+    SOUTH = 1
+    EAST = 2
+    WEST = 3
+    UP = 4
+    DOWN = 5
+
+# direction words in slot order (DIRECTIONS[Direction.UP] == 'up')
+DIRECTIONS = tuple(direction.name.lower() for direction in Direction)
+# direction word or short form -> exit slot
+DIR_IDX = {}
+for _direction in Direction:
+    _word = DIRECTIONS[_direction]
+    DIR_IDX[_word] = DIR_IDX[_word[0]] = _direction
+del _direction, _word
+
+# first letter -> exit slot (0xFF: no direction starts with it); every
+# direction has a distinct first letter, so one byte load finds the slot
+_DIR_BY_FIRST = bytearray(b'\xff' * 256)
+for _slot, _word in enumerate(DIRECTIONS):
+    _DIR_BY_FIRST[ord(_word[0])] = _slot
+_DIR_BY_FIRST = bytes(_DIR_BY_FIRST)
+del _slot, _word
+
+def dir_index(word):
+    # exit slot for a lowercase direction word or short form, else None
+    code = ord(word[0]) if word else 0xFF
+    slot = _DIR_BY_FIRST[code] if code < 256 else 0xFF
+    if slot == 0xFF or (len(word) > 1 and word != DIRECTIONS[slot]):
+        return None
+    return slot
+
+# id -> 64-bit Zobrist key, filled in as ids are first seen
+_ZOBRIST = {}
+
+def zobrist_key(id):
+    # stable random-looking 64-bit key for an id (same in every process)
+    key = _ZOBRIST.get(id)
+    if key is None:
+        key = _ZOBRIST[id] = int.from_bytes(blake2b(id.encode(), digest_size=8).digest(), 'little')
+    return key
+
+def state_hash(location, inventory_ids):
+    # XOR of the keys of the current location and each held item id; moving or
+    # picking something up changes the hash by a single XOR
+    h = location.zhash
+    for item_id in inventory_ids:
+        h ^= zobrist_key(item_id)
+    return h
+
+def build_graph(locations, index):
+    # world adjacency in CSR form: the exit targets of location i (numbered by
+    # `index`, id -> int) are neighbors[offsets[i]:offsets[i + 1]]
+    offsets = array('i', [0])
+    neighbors = array('i')
+    for location in locations:
+        for target in location.exits_v:
+            if target is not None and target in index:
+                neighbors.append(index[target])
+        offsets.append(len(neighbors))
+    return offsets, neighbors
+
+def shortest_path(offsets, neighbors, start, goal):
+    # breadth-first search over a build_graph() graph; list of location
+    # numbers from start to goal, or None if goal can't be reached
+    came_from = {start: start}
+    queue = deque((start,))
+    while queue:
+        i = queue.popleft()
+        if i == goal:
+            path = [i]
+            while i != start:
+                i = came_from[i]
+                path.append(i)
+            path.reverse()
+            return path
+        for j in neighbors[offsets[i]:offsets[i + 1]]:
+            if j not in came_from:
+                came_from[j] = i
+                queue.append(j)
+    return None
+
+# exit pairs -> the (exits, exits_v, exits_str) shared by every location
+# with exactly those exits; exits is a read-only view, since it is shared
+_EXITS_CACHE = {}
 
 class Location(Entity):
+    __slots__ = ('exits', 'exits_v', 'exits_str', 'items', 'enemies', 'flags', 'zhash')
+
     def __init__(self,id ,name, description,exits, items,enemies,is_locked):
         super().__init__(id,name,description)
-        self.exits = exits
+        key = tuple(exits.items())
+        shared = _EXITS_CACHE.get(key)
+        if shared is None:
+            shared = _EXITS_CACHE[key] = (
+                MappingProxyType({sys.intern(direction): sys.intern(target)
+                                  for direction, target in exits.items()}),
+                tuple(exits.get(direction) for direction in DIRECTIONS),
+                ", ".join(exits),  # pre-joined for look/move messages
+            )
+        self.exits, self.exits_v, self.exits_str = shared
         self.items = items
-        self.enemies = enemies 
-        self.is_locked = is_locked
\ No newline at end of file
+        self.enemies = enemies if isinstance(enemies, EnemyTable) else EnemyTable(enemies)
+        self.flags = LOCKED if is_locked else 0
+        self.zhash = zobrist_key(self.entity_id)
+
+    @property
+    def is_locked(self):
+        return bool(self.flags & LOCKED)
+
+    @is_locked.setter
+    def is_locked(self, locked):
+        self.flags = self.flags | LOCKED if locked else self.flags & ~LOCKED
\ No newline at end of file